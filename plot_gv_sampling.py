@@ -1,14 +1,19 @@
+import gzip
+import numpy as np
 import polars as pl
-from argparse import ArgumentParser, Namespace
-from json import dumps as json_dumps
+from argparse import ArgumentParser, ArgumentTypeError, Namespace
 from pathlib import Path
+from typing import Any
 from webbrowser import open_new_tab as wb_open_new_tab
 
 from bokeh.embed import file_html
-from bokeh.layouts import column
-from bokeh.models import Column, ColumnDataSource, HoverTool
-from bokeh.models import Legend  # type: ignore [attr-defined]
+from bokeh.layouts import gridplot
+from bokeh.colors import named as named_colors
+from bokeh.core.property.vectorization import Field
+from bokeh.models import ColumnDataSource, CustomJSTransform, DataRange1d, GlyphRenderer, Line, Scatter
+from bokeh.models import GridPlot, Legend, LegendItem  # type: ignore [attr-defined]
 from bokeh.plotting import figure
+from bokeh.transform import transform
 
 
 ###################
@@ -17,6 +22,7 @@ from bokeh.plotting import figure
 
 # Data
 CSV_DATA_FILE_NAME = 'data.csv'
+PARQUET_CACHE_FILE_NAME = 'data.parquet'
 SCHEMA = pl.Schema(
     {
         'unix_time': pl.Float64,
@@ -30,35 +36,90 @@ SCHEMA = pl.Schema(
         'q_m3h': pl.Float64,
     }
 )
-NULL_VALUES = json_dumps(None)
+NULL_VALUES = 'null'
+DF_SCHEMA = pl.Schema(
+    {
+        'sample_index': pl.Int64,
+        'time_s': pl.Float64,
+        'delta_time_s': pl.Float64,
+        'tm_k': pl.Float64,
+        'pm_bar': pl.Float64,
+        'vg_m3': pl.Float64,
+        'vm_m3': pl.Float64,
+        'vb_m3': pl.Float64,
+        'pulses_reed_1': pl.Int64,
+        'pulses_reed_2': pl.Int64,
+        'integral_q_m3': pl.Float64,
+        'q_m3h': pl.Float64,
+    }
+)
 
 # Plot
 WIDTH = 1000
 HEIGHT = 400
+TOOLS = 'pan,wheel_zoom,box_zoom,reset,save,hover'
 PLOT_HTML_TITLE = 'plot'
 PLOT_HTML_FILE_NAME = PLOT_HTML_TITLE + '.html'
+PLOT_HTML_GZ_FILE_NAME = PLOT_HTML_FILE_NAME + '.gz'
+GZIP_COMPRESS_LEVEL = 6
+DIFF_TRANSFORM_V_FUNC = '''
+const out = new Float64Array(xs.length)
+out[0] = NaN
+for (let i = 1; i < xs.length; i++) {
+    out[i] = xs[i] - xs[i - 1]
+}
+return out
+'''
+DIFF_TRANSFORM_COLUMN_NAMES = (  # kept in 64 bits, 32-bit cumulative totals are too coarse for their deltas
+    'vg_m3',
+    'vm_m3',
+    'vb_m3',
+    'pulses_reed_1',
+    'pulses_reed_2',
+)
+PLOTTED_COLUMN_NAMES = (
+    'time_s',
+    'delta_time_s',
+    'tm_k',
+    'pm_bar',
+    'vg_m3',
+    'vm_m3',
+    'vb_m3',
+    'pulses_reed_1',
+    'pulses_reed_2',
+    'integral_q_m3',
+    'q_m3h',
+)
 
 
 ###################
 #    FUNCTIONS    #
 ###################
 
-def _are_series_data_unique(series: pl.Series) -> bool:
-    return series.n_unique() == len(series)
-
-
-def validate_unix_time_data(unix_times: pl.Series) -> None:
-    if not _are_series_data_unique(unix_times):
+def compute_unix_time_stats(df: pl.DataFrame) -> dict[str, Any]:
+    # compute all UNIX time statistics in a single pass (from the relative times and their deltas)
+    stats = df.select(
+        n_unique=pl.col('time_s').n_unique(),
+        n=pl.len(),
+        n_null=pl.col('time_s').null_count(),
+        is_increasing=(pl.col('delta_time_s') > 0.0).all(),
+        dt_avg=pl.col('delta_time_s').mean(),
+        dt_std=pl.col('delta_time_s').std(),
+    ).row(0, named=True)
+    return stats
+
+
+def validate_unix_time_data(unix_time_stats: dict[str, Any]) -> None:
+    if unix_time_stats['n_unique'] != unix_time_stats['n']:
         raise ValueError(f'UNIX time are not unique.')
-    elif not unix_times.is_sorted():
+    elif unix_time_stats['n_null'] > 0 or not unix_time_stats['is_increasing']:
         raise ValueError(f'UNIX times are not monotonically increasing.')
 
 
-def compute_and_print_timing_diagnostics(unix_times: pl.Series) -> None:
+def print_timing_diagnostics(unix_time_stats: dict[str, Any]) -> None:
     # compute timing diagnostics
-    dt = unix_times.diff()
-    dt_avg = dt.mean()
-    dt_std = dt.std()
+    dt_avg = unix_time_stats['dt_avg']
+    dt_std = unix_time_stats['dt_std']
     assert isinstance(dt_avg, float)  # for MyPy
     assert isinstance(dt_std, float)  # for MyPy
     dt_std_over_avg = dt_std / dt_avg
@@ -73,134 +134,179 @@ def compute_and_print_timing_diagnostics(unix_times: pl.Series) -> None:
     )
 
 
-def get_df(gv_sampling_dir_path: Path | str) -> pl.DataFrame:
-    # get data
+def _validate_and_print_timing_diagnostics(df: pl.DataFrame) -> None:
+    unix_time_stats = compute_unix_time_stats(df)
+    validate_unix_time_data(unix_time_stats)
+    print_timing_diagnostics(unix_time_stats)
+
+
+def _get_src_file_metadata(src_file_path: Path) -> dict[str, str]:
+    src_file_stat = src_file_path.stat()
+    return {'src_size': str(src_file_stat.st_size), 'src_mtime_ns': str(src_file_stat.st_mtime_ns)}
+
+
+def _is_cache_fresh(cache_file_path: Path, src_file_path: Path) -> bool:
+    # cache must match the current dataframe schema and the current source file size and modification time
+    if not cache_file_path.exists():
+        return False
+    if pl.read_parquet_schema(cache_file_path) != dict(DF_SCHEMA):
+        return False
+    cache_metadata = pl.read_parquet_metadata(cache_file_path)
+    return all(cache_metadata.get(key) == value for key, value in _get_src_file_metadata(src_file_path).items())
+
+
+def get_df(gv_sampling_dir_path: Path | str, validate: bool = False) -> pl.DataFrame:
+    # get file paths
     csv_data_file_path = Path(gv_sampling_dir_path) / CSV_DATA_FILE_NAME
-    df = pl.read_csv(csv_data_file_path, schema=SCHEMA, null_values=NULL_VALUES)
-    # handle time data
-    validate_unix_time_data(df['unix_time'])
-    compute_and_print_timing_diagnostics(df['unix_time'])
-    df = df.with_columns(
-        sample_index=pl.arange(len(df)),
+    parquet_cache_file_path = Path(gv_sampling_dir_path) / PARQUET_CACHE_FILE_NAME
+    # get cached dataframe if built by this version from the current CSV data
+    if _is_cache_fresh(parquet_cache_file_path, csv_data_file_path):
+        df = pl.read_parquet(parquet_cache_file_path, memory_map=True)
+        if validate:
+            _validate_and_print_timing_diagnostics(df)
+        return df
+    # get data lazily and create derived columns in final order
+    lf = pl.scan_csv(csv_data_file_path, schema=SCHEMA, null_values=NULL_VALUES)
+    lf = lf.select(
         time_s=pl.col('unix_time') - pl.col('unix_time').min(),
         delta_time_s=pl.col('unix_time').diff(),
+        tm_k=pl.col('tm_k'),
+        pm_bar=pl.col('pm_bar'),
+        vg_m3=pl.col('vg_m3'),
+        vm_m3=pl.col('vm_m3'),
+        vb_m3=pl.col('vb_m3'),
+        pulses_reed_1=pl.col('pulses_reed_1'),
+        pulses_reed_2=pl.col('pulses_reed_2'),
+        integral_q_m3=(pl.col('q_m3h') / 3600.0 * pl.col('unix_time').diff()).cum_sum(),
+        q_m3h=pl.col('q_m3h'),
     )
-    df = df.drop('unix_time')
-    # create delta and cumulative columns
-    df = df.with_columns(
-        delta_vg_m3=pl.col('vg_m3').diff(),
-        delta_vm_m3=pl.col('vm_m3').diff(),
-        delta_vb_m3=pl.col('vb_m3').diff(),
-        delta_pulses_reed_1=pl.col('pulses_reed_1').diff(),
-        delta_pulses_reed_2=pl.col('pulses_reed_2').diff(),
-        integral_q_m3=(pl.col('q_m3h') / 3600.0 * pl.col('delta_time_s')).cum_sum(),
-    )
-    # reorder columns
-    df = df.select(
-        'sample_index',
-        'time_s',
-        'delta_time_s',
-        'tm_k',
-        'pm_bar',
-        'vg_m3',
-        'vm_m3',
-        'vb_m3',
-        'delta_vg_m3',
-        'delta_vm_m3',
-        'delta_vb_m3',
-        'pulses_reed_1',
-        'pulses_reed_2',
-        'delta_pulses_reed_1',
-        'delta_pulses_reed_2',
-        'integral_q_m3',
-        'q_m3h',
-    )
-    # return dataframe
+    # collect dataframe
+    df = lf.collect(engine='streaming')
+    # create sample index column (first column)
+    df.insert_column(0, pl.Series('sample_index', np.arange(len(df), dtype=np.int64)))
+    # validate time data and print timing diagnostics (optional, uses the already computed time deltas)
+    if validate:
+        _validate_and_print_timing_diagnostics(df)
+    # cache and return dataframe
+    df.write_parquet(parquet_cache_file_path, compression='lz4', statistics=False, metadata=_get_src_file_metadata(csv_data_file_path))
     return df
 
 
-def create_column_plot(df: pl.DataFrame) -> Column:
-    # create column data source
-    cds = ColumnDataSource(df)
+def _create_figure(title: str, y_axis_label: str, x_range: DataRange1d) -> figure:
+    # toolbar location is set by the merged toolbar of the grid plot
+    return figure(title=title, x_axis_label='Time (s)', y_axis_label=y_axis_label, x_range=x_range, width=WIDTH, height=HEIGHT, tools=TOOLS)  # type: ignore [call-arg]
+
+
+def _add_trace(fig: figure, cds: ColumnDataSource, y: str | Field, color: str, marker: str = 'circle', size: float = 4.0) -> list[GlyphRenderer]:
+    # add bare line and scatter glyphs (no selection/muted glyph copies), line below markers
+    line_renderer = fig.add_glyph(cds, Line(x='time_s', y=y, line_color=color))
+    scatter_renderer = fig.add_glyph(cds, Scatter(x='time_s', y=y, marker=marker, size=size, line_color=color, fill_color=color, hatch_color=color))
+    return [line_renderer, scatter_renderer]
+
+
+def _compute_density_image(x: np.ndarray, y: np.ndarray, color: str, n_x_bins: int, n_y_bins: int) -> tuple[np.ndarray, float, float, float, float] | None:
+    # bin finite samples on a regular (x, y) grid
+    is_finite = np.isfinite(x) & np.isfinite(y)
+    if not is_finite.any():
+        return None
+    counts, x_edges, y_edges = np.histogram2d(x[is_finite], y[is_finite], bins=(n_x_bins, n_y_bins))
+    # map counts to the alpha channel of the trace color (image rows are y bins)
+    rgb = getattr(named_colors, color)
+    img = np.zeros((n_y_bins, n_x_bins), dtype=np.uint32)
+    img_view = img.view(dtype=np.uint8).reshape((n_y_bins, n_x_bins, 4))
+    img_view[..., 0] = rgb.r
+    img_view[..., 1] = rgb.g
+    img_view[..., 2] = rgb.b
+    img_view[..., 3] = np.where(counts.T > 0, 64.0 + 191.0 * counts.T / counts.max(), 0.0).astype(np.uint8)
+    return img, x_edges[0], y_edges[0], x_edges[-1] - x_edges[0], y_edges[-1] - y_edges[0]
+
+
+def _add_density_image(fig: figure, df: pl.DataFrame, y: str, color: str, n_time_bins: int) -> list[GlyphRenderer]:
+    density_image = _compute_density_image(df['time_s'].to_numpy(), df[y].to_numpy(), color, n_time_bins, HEIGHT)
+    if density_image is None:
+        return []
+    img, x0, y0, dw, dh = density_image
+    return [fig.image_rgba(image=[img], x=x0, y=y0, dw=dw, dh=dh)]
+
+
+def _add_trace_or_density_image(fig: figure, cds: ColumnDataSource, df: pl.DataFrame, y: str, color: str, n_time_bins: int | None, **kwargs: Any) -> list[GlyphRenderer]:
+    if n_time_bins is None:
+        return _add_trace(fig, cds, y, color, **kwargs)
+    return _add_density_image(fig, df, y, color, n_time_bins)
+
+
+def create_column_plot(df: pl.DataFrame, downsample: int | None = None) -> GridPlot:
+    # number of time bins of density images (if they replace points of volumes and flow rate)
+    if downsample is not None and downsample <= 0:
+        raise ValueError(f'Downsample must be a positive integer, got {downsample}.')
+    n_time_bins = downsample if downsample is not None and len(df) > downsample else None
+
+    # create column data source (only with the plotted columns, floats not differenced client-side downcast to 32 bits)
+    # flow rate is only plotted as density image in that case, volumes are still needed for their deltas
+    data = {name: df[name].to_numpy() for name in PLOTTED_COLUMN_NAMES if not (n_time_bins is not None and name == 'q_m3h')}
+    data = {name: arr.astype(np.float32) if arr.dtype == np.float64 and name not in DIFF_TRANSFORM_COLUMN_NAMES else arr for name, arr in data.items()}
+    cds = ColumnDataSource(data)
+
+    # create client-side difference transform (delta columns are not embedded)
+    diff_transform = CustomJSTransform(v_func=DIFF_TRANSFORM_V_FUNC)
+
+    # create time range shared by all figures
+    shared_x_range = DataRange1d()
 
     # plot of time delta
-    fig_dt = figure(title='Time delta', x_axis_label='Time (s)', y_axis_label='Time interval (s)', width=WIDTH, height=HEIGHT, toolbar_location='above')  # type: ignore [call-arg]
-    fig_dt.add_tools(HoverTool())
-    fig_dt.scatter('time_s', 'delta_time_s', source=cds, color='black')
-    fig_dt.line(   'time_s', 'delta_time_s', source=cds, color='black')
+    fig_dt = _create_figure('Time delta', 'Time interval (s)', shared_x_range)
+    _add_trace(fig_dt, cds, 'delta_time_s', 'black')
     assert hasattr(fig_dt.y_range, 'start')  # for MyPy
     fig_dt.y_range.start = 0.0
 
     # # plot of temperature
-    fig_t = figure(title='Temperature', x_axis_label='Time (s)', y_axis_label='Temperature (K)', width=WIDTH, height=HEIGHT, toolbar_location='above')  # type: ignore [call-arg]
-    fig_t.add_tools(HoverTool())
-    fig_t.scatter('time_s', 'tm_k', source=cds, color='grey')
-    fig_t.line(   'time_s', 'tm_k', source=cds, color='grey')
+    fig_t = _create_figure('Temperature', 'Temperature (K)', shared_x_range)
+    _add_trace(fig_t, cds, 'tm_k', 'grey')
 
     # # plot of pressure
-    fig_p = figure(title='Pressure', x_axis_label='Time (s)', y_axis_label='Pressure (bar)', width=WIDTH, height=HEIGHT, toolbar_location='above')  # type: ignore [call-arg]
-    fig_p.add_tools(HoverTool())
-    fig_p.scatter('time_s', 'pm_bar', source=cds, color='grey')
-    fig_p.line(   'time_s', 'pm_bar', source=cds, color='grey')
+    fig_p = _create_figure('Pressure', 'Pressure (bar)', shared_x_range)
+    _add_trace(fig_p, cds, 'pm_bar', 'grey')
 
     # plot of volumes
-    fig_v = figure(title='Volumes', x_axis_label='Time (s)', y_axis_label='Volume (m^3)', width=WIDTH, height=HEIGHT, toolbar_location='above')  # type: ignore [call-arg]
-    fig_v.add_tools(HoverTool())
-    fig_v.add_layout(Legend(), 'right')
-    fig_v.legend.click_policy = 'hide'
-    fig_v.scatter('time_s', 'vg_m3', source=cds, legend_label='Vg', color='red')
-    fig_v.scatter('time_s', 'vm_m3', source=cds, legend_label='Vm', color='green')
-    fig_v.scatter('time_s', 'vb_m3', source=cds, legend_label='Vb', color='blue')
-    fig_v.line(   'time_s', 'vg_m3', source=cds, legend_label='Vg', color='red')
-    fig_v.line(   'time_s', 'vm_m3', source=cds, legend_label='Vm', color='green')
-    fig_v.line(   'time_s', 'vb_m3', source=cds, legend_label='Vb', color='blue')
+    fig_v = _create_figure('Volumes', 'Volume (m^3)', shared_x_range)
+    fig_v.add_layout(Legend(click_policy='hide', items=[
+        LegendItem(label='Vg', renderers=_add_trace_or_density_image(fig_v, cds, df, 'vg_m3', 'red',   n_time_bins)),
+        LegendItem(label='Vm', renderers=_add_trace_or_density_image(fig_v, cds, df, 'vm_m3', 'green', n_time_bins)),
+        LegendItem(label='Vb', renderers=_add_trace_or_density_image(fig_v, cds, df, 'vb_m3', 'blue',  n_time_bins)),
+    ]), 'right')
 
     # plot of delta volumes
-    fig_dv = figure(title='Delta volumes', x_axis_label='Time (s)', y_axis_label='Delta volume (m^3)', width=WIDTH, height=HEIGHT, toolbar_location='above')  # type: ignore [call-arg]
-    fig_dv.add_tools(HoverTool())
-    fig_dv.add_layout(Legend(), 'right')
-    fig_dv.legend.click_policy = 'hide'
-    fig_dv.scatter('time_s', 'delta_vg_m3', source=cds, legend_label='delta Vg', color='red')
-    fig_dv.scatter('time_s', 'delta_vm_m3', source=cds, legend_label='delta Vm', color='green')
-    fig_dv.scatter('time_s', 'delta_vb_m3', source=cds, legend_label='delta Vb', color='blue')
-    fig_dv.line(   'time_s', 'delta_vg_m3', source=cds, legend_label='delta Vg', color='red')
-    fig_dv.line(   'time_s', 'delta_vm_m3', source=cds, legend_label='delta Vm', color='green')
-    fig_dv.line(   'time_s', 'delta_vb_m3', source=cds, legend_label='delta Vb', color='blue')
+    fig_dv = _create_figure('Delta volumes', 'Delta volume (m^3)', shared_x_range)
+    fig_dv.add_layout(Legend(click_policy='hide', items=[
+        LegendItem(label='delta Vg', renderers=_add_trace(fig_dv, cds, transform('vg_m3', diff_transform), 'red')),
+        LegendItem(label='delta Vm', renderers=_add_trace(fig_dv, cds, transform('vm_m3', diff_transform), 'green')),
+        LegendItem(label='delta Vb', renderers=_add_trace(fig_dv, cds, transform('vb_m3', diff_transform), 'blue')),
+    ]), 'right')
 
     # plot of reeds counts
-    fig_rc = figure(title='Reeds counts', x_axis_label='Time (s)', y_axis_label='Counts (adim. natural)', width=WIDTH, height=HEIGHT, toolbar_location='above')  # type: ignore [call-arg]
-    fig_rc.add_tools(HoverTool())
-    fig_rc.add_layout(Legend(), 'right')
-    fig_rc.legend.click_policy = 'hide'
-    fig_rc.scatter('time_s', 'pulses_reed_1', source=cds, legend_label='reed 1', color='crimson', marker='triangle', size=6)
-    fig_rc.scatter('time_s', 'pulses_reed_2', source=cds, legend_label='reed 2', color='maroon',  marker='inverted_triangle', size=6)
-    fig_rc.line(   'time_s', 'pulses_reed_1', source=cds, legend_label='reed 1', color='crimson')
-    fig_rc.line(   'time_s', 'pulses_reed_2', source=cds, legend_label='reed 2', color='maroon')
+    fig_rc = _create_figure('Reeds counts', 'Counts (adim. natural)', shared_x_range)
+    fig_rc.add_layout(Legend(click_policy='hide', items=[
+        LegendItem(label='reed 1', renderers=_add_trace(fig_rc, cds, 'pulses_reed_1', 'crimson', marker='triangle', size=6)),
+        LegendItem(label='reed 2', renderers=_add_trace(fig_rc, cds, 'pulses_reed_2', 'maroon',  marker='inverted_triangle', size=6)),
+    ]), 'right')
 
     # plot of delta reeds counts
-    fig_drc = figure(title='Delta reeds counts', x_axis_label='Time (s)', y_axis_label='Delta counts (adim. natural)', width=WIDTH, height=HEIGHT, toolbar_location='above')  # type: ignore [call-arg]
-    fig_drc.add_tools(HoverTool())
-    fig_drc.add_layout(Legend(), 'right')
-    fig_drc.legend.click_policy = 'hide'
-    fig_drc.scatter('time_s', 'delta_pulses_reed_1', source=cds, legend_label='delta reed 1', color='crimson', marker='triangle', size=6)
-    fig_drc.scatter('time_s', 'delta_pulses_reed_2', source=cds, legend_label='delta reed 2', color='maroon',  marker='inverted_triangle', size=6)
-    fig_drc.line(   'time_s', 'delta_pulses_reed_1', source=cds, legend_label='delta reed 1', color='crimson')
-    fig_drc.line(   'time_s', 'delta_pulses_reed_2', source=cds, legend_label='delta reed 2', color='maroon')
+    fig_drc = _create_figure('Delta reeds counts', 'Delta counts (adim. natural)', shared_x_range)
+    fig_drc.add_layout(Legend(click_policy='hide', items=[
+        LegendItem(label='delta reed 1', renderers=_add_trace(fig_drc, cds, transform('pulses_reed_1', diff_transform), 'crimson', marker='triangle', size=6)),
+        LegendItem(label='delta reed 2', renderers=_add_trace(fig_drc, cds, transform('pulses_reed_2', diff_transform), 'maroon',  marker='inverted_triangle', size=6)),
+    ]), 'right')
 
     # plot of flow rate
-    fig_q = figure(title='Flow rate', x_axis_label='Time (s)', y_axis_label='Flow rate (m^3/h)', width=WIDTH, height=HEIGHT, toolbar_location='above')  # type: ignore [call-arg]
-    fig_q.add_tools(HoverTool())
-    fig_q.scatter('time_s', 'q_m3h', source=cds, color='black', marker='diamond', size=6)
-    fig_q.line(   'time_s', 'q_m3h', source=cds, color='black')
+    fig_q = _create_figure('Flow rate', 'Flow rate (m^3/h)', shared_x_range)
+    _add_trace_or_density_image(fig_q, cds, df, 'q_m3h', 'black', n_time_bins, marker='diamond', size=6)
 
     # plot of integral flow
-    fig_iq = figure(title='Integral flow', x_axis_label='Time (s)', y_axis_label='Flow (m^3)', width=WIDTH, height=HEIGHT, toolbar_location='above')  # type: ignore [call-arg]
-    fig_iq.add_tools(HoverTool())
-    fig_iq.scatter('time_s', 'integral_q_m3', source=cds, color='grey', marker='square')
-    fig_iq.line(   'time_s', 'integral_q_m3', source=cds, color='grey')
+    fig_iq = _create_figure('Integral flow', 'Flow (m^3)', shared_x_range)
+    _add_trace(fig_iq, cds, 'integral_q_m3', 'grey', marker='square')
 
-    # create column plot
-    col = column(
+    # create column plot (single column grid with one merged toolbar)
+    figs = [
         fig_dt,
         fig_t,
         fig_p,
@@ -210,33 +316,37 @@ def create_column_plot(df: pl.DataFrame) -> Column:
         fig_drc,
         fig_q,
         fig_iq,
-    )
-    assert hasattr(col.children[0], 'x_range')  # for MyPy
-    shared_x_range = col.children[0].x_range
-    for f in col.children[1:]:
-        assert hasattr(f, 'x_range')  # for MyPy
-        f.x_range = shared_x_range
+    ]
+    col = gridplot(figs, ncols=1, toolbar_location='above', merge_tools=True)  # type: ignore [arg-type]
 
     # return column plot
     return col
 
 
-def save_column_plot_as_html(col: Column, dst_dir_path: Path | str, open_: bool = False) -> str:
+def save_column_plot_as_html(col: GridPlot, dst_dir_path: Path | str, open_: bool = False, gzip_: bool = False) -> str:
     html_str = file_html(col, title=PLOT_HTML_TITLE)
     html_file_path = Path(dst_dir_path) / PLOT_HTML_FILE_NAME
-    html_file_path.write_text(html_str)
+    html_bytes = html_str.encode('utf-8')
+    html_file_path.write_bytes(html_bytes)
+    html_gz_file_path = Path(dst_dir_path) / PLOT_HTML_GZ_FILE_NAME
+    if gzip_:
+        with gzip.open(html_gz_file_path, 'wb', compresslevel=GZIP_COMPRESS_LEVEL) as f:
+            f.write(html_bytes)
+    else:
+        # remove stale compressed copy of a previous plot
+        html_gz_file_path.unlink(missing_ok=True)
     if open_:
         wb_open_new_tab(str(html_file_path))
     return html_str
 
 
-def plot_gv_sampling(gv_sampling_dir_path: Path | str, open_: bool = False) -> tuple[pl.DataFrame, Column]:
+def plot_gv_sampling(gv_sampling_dir_path: Path | str, open_: bool = False, gzip_: bool = False, validate: bool = False, downsample: int | None = None) -> tuple[pl.DataFrame, GridPlot]:
     # get data
     gv_sampling_dir_path = Path(gv_sampling_dir_path)
-    df = get_df(gv_sampling_dir_path)
+    df = get_df(gv_sampling_dir_path, validate)
     # create, save, open, and return column plot
-    col = create_column_plot(df)
-    save_column_plot_as_html(col, gv_sampling_dir_path, open_)
+    col = create_column_plot(df, downsample)
+    save_column_plot_as_html(col, gv_sampling_dir_path, open_, gzip_)
     return df, col
 
 
@@ -244,10 +354,20 @@ def plot_gv_sampling(gv_sampling_dir_path: Path | str, open_: bool = False) -> t
 #    SCRIPTING    #
 ###################
 
+def _positive_int(value: str) -> int:
+    int_value = int(value)
+    if int_value <= 0:
+        raise ArgumentTypeError(f'{value} is not a positive integer.')
+    return int_value
+
+
 def create_argparser() -> ArgumentParser:
     parser = ArgumentParser()
     parser.add_argument('-d', '--gv-sampling-dir-path', type=Path, required=True, help='GasViewer data directory path.')
     parser.add_argument('-o', '--open', action='store_true', help='Open the plot in the browser (default: False).')
+    parser.add_argument('-z', '--gzip', action='store_true', help='Also save a gzip-compressed copy of the plot (default: False).')
+    parser.add_argument('-v', '--validate', action='store_true', help='Validate UNIX times and print timing diagnostics (default: False).')
+    parser.add_argument('-s', '--downsample', type=_positive_int, default=None, help='Plot volumes and flow rate as density images with this many time bins, if there are more samples (default: None).')
     return parser
 
 
@@ -259,7 +379,7 @@ def parse_args() -> Namespace:
 
 def main() -> None:
     args = parse_args()
-    plot_gv_sampling(args.gv_sampling_dir_path, args.open)
+    plot_gv_sampling(args.gv_sampling_dir_path, args.open, args.gzip, args.validate, args.downsample)
 
 
 if __name__ == '__main__':